@@ -9,6 +9,12 @@ setup(
     install_requires=[
         "requests>=2.31.0",
     ],
+    extras_require={
+        # Incremental JSON decoding of large position histories
+        "stream": ["ijson>=3.1"],
+        # Faster JSON decoding of API responses and encoding of output
+        "fast": ["orjson>=3.0"],
+    },
     entry_points={
         "console_scripts": [
             "tractive-cli=tractive_cli.main:main",
@@ -2,17 +2,102 @@
 API client for Tractive REST API.
 """
 
+import functools
+import hashlib
 import json
+import re
+import threading
 import time
+import uuid
 import random
 import os
 import sys
-from typing import Dict, Any, Optional, List
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from itertools import chain
+from typing import Dict, Any, Optional, List, Iterator, Callable
 from urllib.parse import urljoin
 
 import requests
 
+try:
+    import ijson
+except ImportError:  # Optional: history responses are decoded in one go without it
+    ijson = None
+
 from .auth import TractiveAuth
+from .utils import get_cache_dir, get_config_dir, json_loads
+
+
+# Connections kept per host; also bounds how many calls can usefully run in parallel
+POOL_MAXSIZE = 16
+
+# Login patterns that might be used by Tractive:
+# (endpoint, email field, password field, extra fixed fields)
+LOGIN_PATTERNS = (
+    ('auth/token', 'platform_email', 'platform_token', (('grant_type', 'tractive'),)),
+    ('login', 'email', 'password', ()),
+    ('auth/login', 'username', 'password', ()),
+)
+
+# File (in the config dir) remembering which login endpoint worked last time
+ENDPOINT_CACHE_FILE = 'endpoint.json'
+
+# Subdirectory (in the cache dir) holding conditional-GET responses
+RESPONSE_CACHE_DIR = 'responses'
+
+# Seconds a cached response is used without revalidation when the server sends no
+# max-age; 0 always revalidates, since tracker data includes live battery state
+DEFAULT_CACHE_TTL = 0
+
+# Methods safe to replay after a server error or a request that may have been processed
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+# Upper bound for any single retry sleep, including server-provided Retry-After
+MAX_BACKOFF_SECONDS = 60.0
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _parse_max_age(cache_control: str) -> Optional[int]:
+    """Get the freshness lifetime from a Cache-Control header, if it sets one."""
+    directives = cache_control.lower()
+    if 'no-cache' in directives or 'no-store' in directives:
+        return 0
+    match = re.search(r'max-age=(\d+)', directives)
+    return int(match.group(1)) if match else None
+
+
+def requires_auth(method: Callable) -> Callable:
+    """Log in before calling an API method if no access token is set yet."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.auth.access_token:
+            # Parallel callers wait for a single login instead of each prompting
+            with self._auth_lock:
+                if not self.auth.access_token and not self.login():
+                    raise RuntimeError("Authentication failed")
+        return method(self, *args, **kwargs)
+    return wrapper
 
 
 class TractiveAPIClient:
@@ -28,12 +113,38 @@ class TractiveAPIClient:
             'User-Agent': 'tractive-cli/1.0.0',
             'Accept': 'application/json',
             'Content-Type': 'application/json',
+            'Connection': 'keep-alive',
             'x-tractive-client': '625e533dc3c3b41c28a669f0'
         })
         
+        # Reuse one pooled keep-alive connection per host across all calls
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, pool_block=False)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Rate limiting configuration
         self.max_retries = int(os.getenv('TRACTIVE_MAX_RETRIES', '3'))
         self.base_backoff_ms = int(os.getenv('TRACTIVE_BACKOFF_MS', '1000'))
+        # Total seconds a command may sleep between retries, across all of its requests
+        self.retry_budget = float(os.getenv('TRACTIVE_RETRY_BUDGET', '30'))
+        self._retry_slept = 0.0
+        self._retry_lock = threading.Lock()
+        
+        # Serializes re-login when a token is rejected during parallel calls
+        self._auth_lock = threading.Lock()
+        
+        # Response cache configuration
+        self.cache_ttl = int(os.getenv('TRACTIVE_CACHE_TTL', str(DEFAULT_CACHE_TTL)))
+    
+    def __enter__(self) -> 'TractiveAPIClient':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
     
     def _debug_log(self, message: str):
         """Log debug message if debug mode is enabled."""
@@ -41,51 +152,109 @@ class TractiveAPIClient:
             redacted_message = self.auth.redact_for_debug(message)
             print(f"DEBUG: {redacted_message}", file=sys.stderr)
     
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Get the server-advertised retry delay, with a small jitter, if any."""
+        retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+        if retry_after is None:
+            return None
+        return min(MAX_BACKOFF_SECONDS, retry_after + random.uniform(0.1, 0.3))
+    
+    def _relogin(self, rejected_authorization: Optional[str]):
+        """Replace a rejected access token, unless another thread already did."""
+        # The old token stays in place until login() replaces it, so requests
+        # racing this one still see a token and take the same path
+        with self._auth_lock:
+            if self.session.headers.get('Authorization') == rejected_authorization:
+                self.login()
+    
+    def _backoff(self, prev_sleep: float) -> float:
+        """Compute the next retry sleep using decorrelated jitter."""
+        base_sleep = self.base_backoff_ms / 1000
+        return min(MAX_BACKOFF_SECONDS, random.uniform(base_sleep, prev_sleep * 3))
+    
+    def start_retry_budget(self):
+        """Start the retry sleep budget shared by all requests of one command."""
+        with self._retry_lock:
+            self._retry_slept = 0.0
+    
+    def _reserve_retry_sleep(self, sleep_time: float) -> bool:
+        """Claim sleep time from the retry budget, if enough of it is left."""
+        with self._retry_lock:
+            if self.retry_budget > 0 and self._retry_slept + sleep_time > self.retry_budget:
+                self._debug_log(f"Retry budget exhausted, not sleeping {sleep_time:.2f}s")
+                return False
+            self._retry_slept += sleep_time
+            return True
+    
+    def _make_request(self, method: str, endpoint: str, stream: bool = False,
+                      reauth: bool = True, idempotent: Optional[bool] = None,
+                      **kwargs) -> requests.Response:
         """Make HTTP request with retry logic and rate limiting."""
         url = urljoin(self.base_url, endpoint)
+        prev_sleep = self.base_backoff_ms / 1000
+        kwargs.setdefault('stream', stream)
+        
+        # Rate-limited requests were not processed and are always retried; server
+        # errors and network failures are only retried if replaying is safe
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        max_error_retries = self.max_retries if idempotent else 0
         
         for attempt in range(self.max_retries + 1):
             try:
-                self._debug_log(f"{method.upper()} {url}")
+                if self.debug:
+                    self._debug_log(f"{method.upper()} {url}")
                 response = self.session.request(method, url, **kwargs)
                 
+                # Log in again once if the access token has expired, then replay
+                rejected_authorization = response.request.headers.get('Authorization')
+                if response.status_code == 401 and reauth and rejected_authorization is not None:
+                    self._debug_log("Access token rejected, logging in again")
+                    response.close()
+                    self._relogin(rejected_authorization)
+                    return self._make_request(method, endpoint, reauth=False,
+                                              idempotent=idempotent, **kwargs)
+                
                 # Handle rate limiting
                 if response.status_code == 429:
-                    if attempt < self.max_retries:
-                        backoff = (self.base_backoff_ms / 1000) * (2 ** attempt)
-                        jitter = random.uniform(0.1, 0.3) * backoff
-                        sleep_time = backoff + jitter
-                        
+                    sleep_time = self._retry_after(response)
+                    if sleep_time is None:
+                        sleep_time = self._backoff(prev_sleep)
+                    
+                    if attempt < self.max_retries and self._reserve_retry_sleep(sleep_time):
+                        prev_sleep = sleep_time
                         self._debug_log(f"Rate limited, sleeping {sleep_time:.2f}s")
+                        response.close()
                         time.sleep(sleep_time)
                         continue
                     else:
-                        print("Rate limit exceeded, max retries reached", file=sys.stderr)
+                        reason = "retry budget exhausted" if attempt < self.max_retries else "max retries reached"
+                        print(f"Rate limit exceeded, {reason}", file=sys.stderr)
                         sys.exit(4)
                 
                 # Handle server errors with backoff
                 if response.status_code >= 500:
-                    if attempt < self.max_retries:
-                        backoff = (self.base_backoff_ms / 1000) * (2 ** attempt)
-                        jitter = random.uniform(0.1, 0.3) * backoff
-                        sleep_time = backoff + jitter
-                        
+                    sleep_time = self._retry_after(response)
+                    if sleep_time is None:
+                        sleep_time = self._backoff(prev_sleep)
+                    
+                    if attempt < max_error_retries and self._reserve_retry_sleep(sleep_time):
+                        prev_sleep = sleep_time
                         self._debug_log(f"Server error {response.status_code}, sleeping {sleep_time:.2f}s")
+                        response.close()
                         time.sleep(sleep_time)
                         continue
                     else:
-                        print(f"Server error {response.status_code}, max retries reached", file=sys.stderr)
+                        reason = "retry budget exhausted" if attempt < max_error_retries else "max retries reached"
+                        print(f"Server error {response.status_code}, {reason}", file=sys.stderr)
                         sys.exit(3)
                 
                 return response
                 
             except requests.exceptions.ConnectionError as e:
-                if attempt < self.max_retries:
-                    backoff = (self.base_backoff_ms / 1000) * (2 ** attempt)
-                    jitter = random.uniform(0.1, 0.3) * backoff
-                    sleep_time = backoff + jitter
-                    
+                sleep_time = self._backoff(prev_sleep)
+                if attempt < max_error_retries and self._reserve_retry_sleep(sleep_time):
+                    prev_sleep = sleep_time
                     self._debug_log(f"Connection error, sleeping {sleep_time:.2f}s")
                     time.sleep(sleep_time)
                     continue
@@ -94,11 +263,9 @@ class TractiveAPIClient:
                     sys.exit(3)
             
             except requests.exceptions.Timeout as e:
-                if attempt < self.max_retries:
-                    backoff = (self.base_backoff_ms / 1000) * (2 ** attempt)
-                    jitter = random.uniform(0.1, 0.3) * backoff
-                    sleep_time = backoff + jitter
-                    
+                sleep_time = self._backoff(prev_sleep)
+                if attempt < max_error_retries and self._reserve_retry_sleep(sleep_time):
+                    prev_sleep = sleep_time
                     self._debug_log(f"Timeout error, sleeping {sleep_time:.2f}s")
                     time.sleep(sleep_time)
                     continue
@@ -109,43 +276,131 @@ class TractiveAPIClient:
         # Should never reach here
         raise RuntimeError("Request failed after all retries")
     
+    def _load_cached_endpoint(self) -> Optional[str]:
+        """Get the login endpoint that last succeeded against this base URL."""
+        try:
+            with open(os.path.join(get_config_dir(), ENDPOINT_CACHE_FILE)) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(cached, dict) or cached.get('base_url') != self.base_url:
+            return None
+        return cached.get('endpoint')
+    
+    def _save_cached_endpoint(self, endpoint: str):
+        """Remember the working login endpoint for later invocations."""
+        try:
+            config_dir = get_config_dir()
+            os.makedirs(config_dir, exist_ok=True)
+            with open(os.path.join(config_dir, ENDPOINT_CACHE_FILE), 'w') as f:
+                json.dump({'base_url': self.base_url, 'endpoint': endpoint}, f)
+        except OSError as e:
+            self._debug_log(f"Could not cache login endpoint: {e}")
+    
+    def _response_cache_path(self, endpoint: str) -> str:
+        """Get the cache file for an endpoint, keyed by base URL and user."""
+        key = hashlib.sha256(f"{self.base_url}|{self.auth.user_id}|{endpoint}".encode()).hexdigest()
+        return os.path.join(get_cache_dir(), RESPONSE_CACHE_DIR, f"{key}.json")
+    
+    def _load_cached_response(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Load a previously cached response body with its validators."""
+        try:
+            with open(self._response_cache_path(endpoint)) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(cached, dict) or 'body' not in cached:
+            return None
+        return cached
+    
+    def _save_cached_response(self, endpoint: str, body: Any, etag: Optional[str],
+                              cache_control: str):
+        """Store a response body with its ETag and freshness lifetime."""
+        if 'no-store' in cache_control.lower():
+            return
+        
+        # Without an ETag to revalidate or any freshness the entry can never be reused
+        max_age = _parse_max_age(cache_control)
+        if not etag and (self.cache_ttl if max_age is None else max_age) <= 0:
+            return
+        
+        cached = {
+            'etag': etag,
+            'stored_at': time.time(),
+            'max_age': max_age,
+            'body': body
+        }
+        
+        try:
+            path = self._response_cache_path(endpoint)
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            # Tracker and geofence data is private to the user
+            with open(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as f:
+                json.dump(cached, f)
+        except OSError as e:
+            self._debug_log(f"Could not cache response for {endpoint}: {e}")
+    
+    def _get_cached(self, endpoint: str, description: str) -> Any:
+        """GET near-static data, reusing or revalidating a cached copy via ETag."""
+        cached = self._load_cached_response(endpoint)
+        headers = {}
+        
+        if cached:
+            max_age = cached.get('max_age')
+            if max_age is None:
+                max_age = self.cache_ttl
+            if time.time() - cached.get('stored_at', 0) < max_age:
+                self._debug_log(f"Using cached response for {endpoint}")
+                return cached['body']
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+        
+        response = self._make_request('GET', endpoint, headers=headers)
+        cache_control = response.headers.get('Cache-Control', '')
+        
+        if response.status_code == 304 and cached:
+            self._debug_log(f"Not modified, using cached response for {endpoint}")
+            etag = response.headers.get('ETag') or cached.get('etag')
+            self._save_cached_response(endpoint, cached['body'], etag, cache_control)
+            return cached['body']
+        elif response.status_code == 200:
+            body = json_loads(response.content)
+            self._save_cached_response(endpoint, body, response.headers.get('ETag'), cache_control)
+            return body
+        else:
+            raise RuntimeError(f"Failed to get {description}: {response.status_code}")
+    
+    def _preconnect(self):
+        """Open a pooled connection to the API host ahead of the first request."""
+        try:
+            self.session.head(self.base_url, timeout=5).close()
+        except requests.exceptions.RequestException:
+            pass  # The real request will connect (and report errors) itself
+    
     def login(self) -> bool:
         """Authenticate with Tractive and obtain access token."""
+        # Warm up the TCP/TLS connection while the user types credentials
+        if self.auth.needs_prompt() and os.getenv('TRACTIVE_PRECONNECT', '1') != '0':
+            threading.Thread(target=self._preconnect, daemon=True).start()
+        
         email, password = self.auth.get_credentials()
         
-        # Try different login patterns that might be used by Tractive
-        login_patterns = [
-            {
-                "endpoint": 'auth/token',
-                "data": {
-                    "platform_email": email,
-                    "platform_token": password,
-                    "grant_type": "tractive"
-                }
-            },
-            {
-                "endpoint": 'login',
-                "data": {
-                    "email": email,
-                    "password": password
-                }
-            },
-            {
-                "endpoint": 'auth/login',
-                "data": {
-                    "username": email,
-                    "password": password
-                }
-            }
-        ]
+        # Try the endpoint that worked last time first, and only probe the rest if it fails
+        login_patterns = LOGIN_PATTERNS
+        cached_endpoint = self._load_cached_endpoint()
+        if cached_endpoint:
+            login_patterns = sorted(LOGIN_PATTERNS, key=lambda pattern: pattern[0] != cached_endpoint)
         
-        for pattern in login_patterns:
+        for endpoint, email_field, password_field, extra_fields in login_patterns:
+            payload = {email_field: email, password_field: password, **dict(extra_fields)}
             try:
-                self._debug_log(f"Trying login pattern: {pattern['endpoint']}")
-                response = self._make_request('POST', pattern['endpoint'], json=pattern['data'])
+                self._debug_log(f"Trying login pattern: {endpoint}")
+                response = self._make_request('POST', endpoint, reauth=False, json=payload)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = json_loads(response.content)
                     self._debug_log(f"Received 200 OK response")
                     
                     # Handle different response formats
@@ -166,22 +421,26 @@ class TractiveAPIClient:
                         # Set authorization header for future requests
                         self.session.headers['Authorization'] = f'Bearer {access_token}'
                         self._debug_log("Login successful")
+                        
+                        if endpoint != cached_endpoint:
+                            self._save_cached_endpoint(endpoint)
                         return True
                 
                 elif response.status_code in [401, 403]:
                     # Log detailed error information
                     self._debug_log(f"Login failed with status {response.status_code}")
                     try:
-                        error_data = response.json()
+                        error_data = json_loads(response.content)
                         self._debug_log(f"Response body: {json.dumps(error_data)}")
                     except:
                         self._debug_log(f"Response body: {response.text}")
                     
-                    # Continue trying other patterns for non-auth errors
-                    if pattern == login_patterns[-1]:  # Last pattern
+                    # Continue trying other patterns for non-auth errors; the
+                    # last pattern or a previously working endpoint is definitive
+                    if endpoint in (login_patterns[-1][0], cached_endpoint):
                         error_msg = "Invalid credentials"
                         try:
-                            error_data = response.json()
+                            error_data = json_loads(response.content)
                             error_msg = error_data.get('message', error_msg)
                         except:
                             pass
@@ -191,14 +450,14 @@ class TractiveAPIClient:
                 else:
                     self._debug_log(f"Login failed with status {response.status_code}")
                     try:
-                        error_data = response.json()
+                        error_data = json_loads(response.content)
                         self._debug_log(f"Response body: {json.dumps(error_data)}")
                     except:
                         self._debug_log(f"Response body: {response.text}")
                     continue
                     
             except Exception as e:
-                self._debug_log(f"Login error with pattern {pattern['endpoint']}: {e}")
+                self._debug_log(f"Login error with pattern {endpoint}: {e}")
                 continue
         
         self._debug_log("All login patterns failed")
@@ -206,42 +465,28 @@ class TractiveAPIClient:
         print("Authentication failed", file=sys.stderr)
         sys.exit(2)
     
+    @requires_auth
     def get_trackers(self) -> List[Dict[str, Any]]:
         """Get list of user's trackers."""
-        if not self.auth.access_token:
-            if not self.login():
-                raise RuntimeError("Authentication failed")
-        
-        response = self._make_request('GET', f'user/{self.auth.user_id}/trackers')
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise RuntimeError(f"Failed to get trackers: {response.status_code}")
+        return self._get_cached(f'user/{self.auth.user_id}/trackers', 'trackers')
     
+    @requires_auth
     def get_tracker_details(self, tracker_id: str) -> Dict[str, Any]:
         """Get detailed information about a specific tracker."""
-        if not self.auth.access_token:
-            if not self.login():
-                raise RuntimeError("Authentication failed")
-        
         response = self._make_request('GET', f'tracker/{tracker_id}')
         
         if response.status_code == 200:
-            return response.json()
+            return json_loads(response.content)
         else:
             raise RuntimeError(f"Failed to get tracker details: {response.status_code}")
     
+    @requires_auth
     def get_latest_position(self, tracker_id: str) -> Dict[str, Any]:
         """Get latest position for a tracker."""
-        if not self.auth.access_token:
-            if not self.login():
-                raise RuntimeError("Authentication failed")
-        
         response = self._make_request('GET', f'tracker/{tracker_id}/pos_report')
         
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             # Handle different response formats
             if isinstance(data, list):
                 # If it's a list, return the first item or an empty dict
@@ -256,10 +501,12 @@ class TractiveAPIClient:
     def get_position_history(self, tracker_id: str, from_time: str, to_time: str, 
                            max_points: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get position history for a tracker."""
-        if not self.auth.access_token:
-            if not self.login():
-                raise RuntimeError("Authentication failed")
-        
+        return list(self.iter_position_history(tracker_id, from_time, to_time, max_points))
+    
+    @requires_auth
+    def iter_position_history(self, tracker_id: str, from_time: str, to_time: str,
+                              max_points: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield position history for a tracker as the response is decoded."""
         params = {
             'time_from': from_time,
             'time_to': to_time
@@ -269,43 +516,56 @@ class TractiveAPIClient:
             params['format'] = 'json_segments'
             params['segments'] = max_points
         
-        response = self._make_request('GET', f'tracker/{tracker_id}/positions', params=params)
+        response = self._make_request('GET', f'tracker/{tracker_id}/positions',
+                                      stream=True, params=params)
         
-        if response.status_code == 200:
-            data = response.json()
-            # Handle different response formats
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict) and 'positions' in data:
-                return data['positions']
+        with response:
+            if response.status_code != 200:
+                raise RuntimeError(f"Failed to get position history: {response.status_code}")
+            
+            if ijson is None:
+                yield from self._extract_positions(json_loads(response.content))
+                return
+            
+            # Peek at the first event: top-level arrays are streamed item by
+            # item, any other shape is decoded whole and handled as before
+            response.raw.decode_content = True
+            events = ijson.parse(response.raw, use_float=True)
+            first_event = next(events, None)
+            if first_event is None:
+                return
+            
+            events = chain([first_event], events)
+            if first_event[1] == 'start_array':
+                yield from ijson.items(events, 'item')
             else:
-                return [data]
+                yield from self._extract_positions(next(ijson.items(events, '')))
+    
+    @staticmethod
+    def _extract_positions(data: Any) -> List[Dict[str, Any]]:
+        """Normalize the different position history response formats to a list."""
+        if isinstance(data, list):
+            return data
+        elif isinstance(data, dict) and 'positions' in data:
+            return data['positions']
         else:
-            raise RuntimeError(f"Failed to get position history: {response.status_code}")
+            return [data]
     
+    @requires_auth
     def get_geofences(self, tracker_id: str) -> List[Dict[str, Any]]:
         """Get geofences for a tracker."""
-        if not self.auth.access_token:
-            if not self.login():
-                raise RuntimeError("Authentication failed")
-        
-        response = self._make_request('GET', f'tracker/{tracker_id}/geofences')
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise RuntimeError(f"Failed to get geofences: {response.status_code}")
+        return self._get_cached(f'tracker/{tracker_id}/geofences', 'geofences')
     
+    @requires_auth
     def set_live_tracking(self, tracker_id: str, enabled: bool) -> Dict[str, Any]:
         """Enable or disable live tracking for a tracker."""
-        if not self.auth.access_token:
-            if not self.login():
-                raise RuntimeError("Authentication failed")
-        
         data = {'live_tracking': enabled}
-        response = self._make_request('PUT', f'tracker/{tracker_id}/live_tracking', json=data)
+        # The same key is re-sent on every retry so the server can drop duplicates
+        headers = {'Idempotency-Key': str(uuid.uuid4())}
+        response = self._make_request('PUT', f'tracker/{tracker_id}/live_tracking',
+                                      json=data, headers=headers)
         
         if response.status_code == 200:
-            return response.json()
+            return json_loads(response.content)
         else:
             raise RuntimeError(f"Failed to set live tracking: {response.status_code}")
\ No newline at end of file
@@ -4,8 +4,9 @@ Authentication module for Tractive CLI.
 
 import os
 import getpass
+import re
 import sys
-from typing import Optional
+from typing import Optional, Pattern
 
 
 class TractiveAuth:
@@ -17,11 +18,18 @@ class TractiveAuth:
         self._password: Optional[str] = None
         self._access_token: Optional[str] = None
         self._user_id: Optional[str] = None
+        self._redact_pattern: Optional[Pattern[str]] = None
+    
+    def needs_prompt(self) -> bool:
+        """Check whether get_credentials will have to ask the user for input."""
+        return not ((os.getenv('TRACTIVE_EMAIL') or self._email) and
+                    (os.getenv('TRACTIVE_PASSWORD') or self._password))
     
     def get_credentials(self) -> tuple[str, str]:
         """Get email and password from environment or prompt."""
-        email = os.getenv('TRACTIVE_EMAIL')
-        password = os.getenv('TRACTIVE_PASSWORD')
+        # Reuse what was already entered, e.g. when logging in again after a token expires
+        email = os.getenv('TRACTIVE_EMAIL') or self._email
+        password = os.getenv('TRACTIVE_PASSWORD') or self._password
         
         if not email:
             try:
@@ -42,6 +50,7 @@ class TractiveAuth:
         
         self._email = email
         self._password = password
+        self._update_redact_pattern()
         return email, password
     
     @property
@@ -53,6 +62,7 @@ class TractiveAuth:
     def access_token(self, token: str):
         """Set the access token."""
         self._access_token = token
+        self._update_redact_pattern()
     
     @property
     def user_id(self) -> Optional[str]:
@@ -64,16 +74,19 @@ class TractiveAuth:
         """Set the user ID."""
         self._user_id = user_id
     
+    def _update_redact_pattern(self):
+        """Compile one alternation matching every secret currently held."""
+        if not self.debug:
+            return
+        
+        # Longest first so a secret containing another is redacted whole
+        sensitive = sorted((x for x in (self._password, self._access_token) if x), key=len, reverse=True)
+        self._redact_pattern = re.compile('|'.join(map(re.escape, sensitive))) if sensitive else None
+    
     def redact_for_debug(self, text: str) -> str:
         """Redact sensitive information from debug output."""
-        if not self.debug:
+        if not self.debug or self._redact_pattern is None:
             return text
-            
-        # Redact password and tokens
-        if self._password and self._password in text:
-            text = text.replace(self._password, '[REDACTED]')
         
-        if self._access_token and self._access_token in text:
-            text = text.replace(self._access_token, '[REDACTED]')
-            
-        return text
\ No newline at end of file
+        # Redact password and tokens
+        return self._redact_pattern.sub('[REDACTED]', text)
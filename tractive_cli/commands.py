@@ -2,15 +2,19 @@
 Command handlers for Tractive CLI.
 """
 
-import json
 import sys
 import csv
-import io
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import List, Dict, Any, Optional, Iterable
 from datetime import datetime
 
-from .api_client import TractiveAPIClient
-from .utils import format_timestamp
+from .api_client import TractiveAPIClient, POOL_MAXSIZE
+from .utils import format_timestamp, json_dumps
+
+
+# Keys carried by the bare tracker references the tracker list endpoint may return
+TRACKER_REFERENCE_KEYS = {'_id', '_type', '_version'}
 
 
 class Commands:
@@ -22,6 +26,8 @@ class Commands:
     def login_test(self) -> int:
         """Test login credentials."""
         try:
+            self.api_client.start_retry_budget()
+            
             if self.api_client.login():
                 print("OK")
                 return 0
@@ -32,42 +38,49 @@ class Commands:
             print(f"Login test failed: {e}", file=sys.stderr)
             return 1
     
-    def trackers(self, format_type: str = 'json', battery_only: bool = False) -> int:
+    def trackers(self, format_type: str = 'json', battery_only: bool = False,
+                 parallel: int = 4) -> int:
         """List trackers."""
         try:
+            self.api_client.start_retry_budget()
+            
             trackers_data = self.api_client.get_trackers()
             
             if not trackers_data:
                 print("No trackers found")
                 return 0
             
-            # Prepare output data
-            output_data = []
-            for tracker in trackers_data:
-                tracker_info = {
-                    'id': tracker.get('_id'),
-                    'name': tracker.get('name', ''),
-                    'pet_name': tracker.get('pet_name', ''),
-                    'model': tracker.get('model', ''),
-                    'firmware': tracker.get('fw_version', ''),
-                    'battery_level': tracker.get('battery_level', 0),
-                    'charging': tracker.get('charging', False),
-                    'last_seen': format_timestamp(tracker.get('time'))
-                }
-                
-                if battery_only:
-                    output_data.append({
-                        'id': tracker_info['id'],
-                        'battery_level': tracker_info['battery_level']
-                    })
-                else:
-                    output_data.append(tracker_info)
+            trackers_data = self._fetch_tracker_details(trackers_data, parallel)
+            
+            # Prepare output data, projecting only the requested fields
+            if battery_only:
+                output_data = [
+                    {
+                        'id': tracker.get('_id'),
+                        'battery_level': tracker.get('battery_level', 0)
+                    }
+                    for tracker in trackers_data
+                ]
+            else:
+                output_data = [
+                    {
+                        'id': tracker.get('_id'),
+                        'name': tracker.get('name', ''),
+                        'pet_name': tracker.get('pet_name', ''),
+                        'model': tracker.get('model', ''),
+                        'firmware': tracker.get('fw_version', ''),
+                        'battery_level': tracker.get('battery_level', 0),
+                        'charging': tracker.get('charging', False),
+                        'last_seen': format_timestamp(tracker.get('time'))
+                    }
+                    for tracker in trackers_data
+                ]
             
             # Output in requested format
             if format_type == 'csv':
                 self._output_csv(output_data)
             else:
-                print(json.dumps(output_data, indent=2))
+                print(json_dumps(output_data))
             
             return 0
             
@@ -78,6 +91,8 @@ class Commands:
     def latest(self, tracker_id: str, format_type: str = 'json') -> int:
         """Get latest position for a tracker."""
         try:
+            self.api_client.start_retry_budget()
+            
             position_data = self.api_client.get_latest_position(tracker_id)
             
             # Format position data
@@ -94,7 +109,7 @@ class Commands:
             if format_type == 'csv':
                 self._output_csv([position_info])
             else:
-                print(json.dumps(position_info, indent=2))
+                print(json_dumps(position_info))
             
             return 0
             
@@ -106,18 +121,24 @@ class Commands:
                 format_type: str = 'json', max_points: Optional[int] = None) -> int:
         """Get position history for a tracker."""
         try:
-            history_data = self.api_client.get_position_history(
+            self.api_client.start_retry_budget()
+            
+            history_data = self.api_client.iter_position_history(
                 tracker_id, from_time, to_time, max_points
             )
             
-            if not history_data:
-                print("No position history found")
-                return 0
-            
-            # Format position data
-            formatted_positions = []
-            for position in history_data:
-                position_info = {
+            # Apply max_points limit if specified and not handled by API; the
+            # raw points are thinned before any of them is formatted
+            if max_points:
+                history_data = list(history_data)
+                # Simple downsampling - take every nth point; the ceiling stride yields
+                # at most max_points points spread across the whole time range
+                step = -(-len(history_data) // max_points)
+                history_data = history_data[::step]
+            
+            # Format position data lazily as it is decoded
+            formatted_positions = (
+                {
                     'time': format_timestamp(position.get('time')),
                     'lat': position.get('lat'),
                     'lng': position.get('lng'),
@@ -125,20 +146,21 @@ class Commands:
                     'accuracy': position.get('accuracy'),
                     'altitude': position.get('altitude')
                 }
-                formatted_positions.append(position_info)
+                for position in history_data
+            )
             
-            # Apply max_points limit if specified and not handled by API
-            if max_points and len(formatted_positions) > max_points:
-                # Simple downsampling - take every nth point
-                step = len(formatted_positions) // max_points
-                if step > 1:
-                    formatted_positions = formatted_positions[::step][:max_points]
+            positions = iter(formatted_positions)
+            first_position = next(positions, None)
+            if first_position is None:
+                print("No position history found")
+                return 0
+            positions = chain([first_position], positions)
             
-            # Output in requested format
+            # Output in requested format; CSV rows are written as they are produced
             if format_type == 'csv':
-                self._output_csv(formatted_positions)
+                self._output_csv(positions)
             else:
-                print(json.dumps(formatted_positions, indent=2))
+                print(json_dumps(list(positions)))
             
             return 0
             
@@ -149,6 +171,8 @@ class Commands:
     def geofences(self, tracker_id: str) -> int:
         """Get geofences for a tracker."""
         try:
+            self.api_client.start_retry_budget()
+            
             geofences_data = self.api_client.get_geofences(tracker_id)
             
             if not geofences_data:
@@ -156,18 +180,18 @@ class Commands:
                 return 0
             
             # Format geofences data
-            formatted_geofences = []
-            for geofence in geofences_data:
-                geofence_info = {
+            formatted_geofences = [
+                {
                     'name': geofence.get('name', ''),
                     'type': geofence.get('type', ''),
                     'enabled': geofence.get('enabled', False),
                     'coordinates': geofence.get('coordinates', []),
                     'radius': geofence.get('radius')  # Only for circle type
                 }
-                formatted_geofences.append(geofence_info)
+                for geofence in geofences_data
+            ]
             
-            print(json.dumps(formatted_geofences, indent=2))
+            print(json_dumps(formatted_geofences))
             return 0
             
         except Exception as e:
@@ -177,6 +201,8 @@ class Commands:
     def live(self, tracker_id: str, enable: bool) -> int:
         """Toggle live tracking for a tracker."""
         try:
+            self.api_client.start_retry_budget()
+            
             result = self.api_client.set_live_tracking(tracker_id, enable)
             
             # Output the resulting state
@@ -186,22 +212,35 @@ class Commands:
                 'status': 'enabled' if enable else 'disabled'
             }
             
-            print(json.dumps(state, indent=2))
+            print(json_dumps(state))
             return 0
             
         except Exception as e:
             print(f"Failed to toggle live tracking: {e}", file=sys.stderr)
             return 1
     
-    def _output_csv(self, data: List[Dict[str, Any]]):
-        """Output data in CSV format."""
-        if not data:
+    def _fetch_tracker_details(self, trackers_data: List[Dict[str, Any]],
+                               parallel: int) -> List[Dict[str, Any]]:
+        """Replace bare tracker references with their details, fetched concurrently."""
+        tracker_ids = [tracker.get('_id') for tracker in trackers_data
+                       if set(tracker) <= TRACKER_REFERENCE_KEYS]
+        if not tracker_ids:
+            return trackers_data
+        
+        max_workers = max(1, min(parallel, POOL_MAXSIZE, len(tracker_ids)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            details = dict(zip(tracker_ids, executor.map(self.api_client.get_tracker_details, tracker_ids)))
+        
+        return [details.get(tracker.get('_id'), tracker) for tracker in trackers_data]
+    
+    def _output_csv(self, data: Iterable[Dict[str, Any]]):
+        """Output data in CSV format, writing rows straight to stdout."""
+        rows = iter(data)
+        first_row = next(rows, None)
+        if first_row is None:
             return
         
-        # Create CSV output
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=data[0].keys())
+        writer = csv.DictWriter(sys.stdout, fieldnames=first_row.keys(), lineterminator='\n')
         writer.writeheader()
-        writer.writerows(data)
-        
-        print(output.getvalue().strip())
\ No newline at end of file
+        writer.writerow(first_row)
+        writer.writerows(rows)
@@ -7,12 +7,8 @@ This tool uses unofficial Tractive APIs and may break if Tractive changes endpoi
 import argparse
 import os
 import sys
-import json
 from typing import Optional
 
-from .auth import TractiveAuth
-from .api_client import TractiveAPIClient
-from .commands import Commands
 from .utils import setup_debug_logging, print_disclaimer
 
 
@@ -28,6 +24,9 @@ Environment Variables:
   TRACTIVE_PASSWORD     Password for Tractive account
   TRACTIVE_MAX_RETRIES  Maximum number of retries (default: 3)
   TRACTIVE_BACKOFF_MS   Base backoff time in ms (default: 1000)
+  TRACTIVE_RETRY_BUDGET Max seconds a command sleeps between retries (default: 30)
+  TRACTIVE_CACHE_TTL    Seconds to reuse cached trackers/geofences (default: 0)
+  TRACTIVE_PRECONNECT   Set to 0 to disable connecting while prompting for credentials
 
 Exit Codes:
   0   Success
@@ -58,6 +57,7 @@ Examples:
     trackers_parser = subparsers.add_parser('trackers', help='List trackers')
     trackers_parser.add_argument('--format', choices=['json', 'csv'], default='json', help='Output format')
     trackers_parser.add_argument('--battery-only', action='store_true', help='Show only battery percentages')
+    trackers_parser.add_argument('--parallel', type=int, default=4, help='Concurrent tracker detail requests (default: 4)')
     
     # latest command
     latest_parser = subparsers.add_parser('latest', help='Get latest position')
@@ -102,49 +102,55 @@ def main():
         parser.print_help()
         return 0
     
+    # Imported only once a command runs, so --help and bare invocations
+    # don't pay for loading requests and its dependencies
+    from .auth import TractiveAuth
+    from .api_client import TractiveAPIClient
+    from .commands import Commands
+    
     try:
         # Initialize auth and API client
         auth = TractiveAuth(debug=args.debug)
-        api_client = TractiveAPIClient(
+        with TractiveAPIClient(
             auth=auth,
             base_url=args.base_url,
             debug=args.debug
-        )
-        
-        # Initialize commands handler
-        commands = Commands(api_client)
-        
-        # Route to appropriate command
-        if args.command == 'login-test':
-            return commands.login_test()
-        elif args.command == 'trackers':
-            return commands.trackers(
-                format_type=args.format,
-                battery_only=args.battery_only
-            )
-        elif args.command == 'latest':
-            return commands.latest(
-                tracker_id=args.tracker,
-                format_type=args.format
-            )
-        elif args.command == 'history':
-            return commands.history(
-                tracker_id=args.tracker,
-                from_time=args.from_time,
-                to_time=args.to_time,
-                format_type=args.format,
-                max_points=args.max_points
-            )
-        elif args.command == 'geofences':
-            return commands.geofences(tracker_id=args.tracker)
-        elif args.command == 'live':
-            return commands.live(
-                tracker_id=args.tracker,
-                enable=args.on
-            )
-        else:
-            print(f"Unknown command: {args.command}", file=sys.stderr)
-            return 1
+        ) as api_client:
+            # Initialize commands handler
+            commands = Commands(api_client)
+            
+            # Route to appropriate command
+            if args.command == 'login-test':
+                return commands.login_test()
+            elif args.command == 'trackers':
+                return commands.trackers(
+                    format_type=args.format,
+                    battery_only=args.battery_only,
+                    parallel=args.parallel
+                )
+            elif args.command == 'latest':
+                return commands.latest(
+                    tracker_id=args.tracker,
+                    format_type=args.format
+                )
+            elif args.command == 'history':
+                return commands.history(
+                    tracker_id=args.tracker,
+                    from_time=args.from_time,
+                    to_time=args.to_time,
+                    format_type=args.format,
+                    max_points=args.max_points
+                )
+            elif args.command == 'geofences':
+                return commands.geofences(tracker_id=args.tracker)
+            elif args.command == 'live':
+                return commands.live(
+                    tracker_id=args.tracker,
+                    enable=args.on
+                )
+            else:
+                print(f"Unknown command: {args.command}", file=sys.stderr)
+                return 1
             
     except KeyboardInterrupt:
         print("\nInterrupted by user", file=sys.stderr)
@@ -2,11 +2,13 @@
 Utility functions for Tractive CLI.
 """
 
+import functools
+import json
 import logging
 import sys
 import os
-from typing import Optional
-from datetime import datetime
+import time
+from typing import Any, Optional, Tuple, Union
 
 
 def setup_debug_logging():
@@ -18,34 +20,93 @@ def setup_debug_logging():
     )
 
 
-def format_timestamp(timestamp: Optional[str]) -> Optional[str]:
+@functools.lru_cache(maxsize=1)
+def _orjson():
+    """Import orjson on first use, keeping it off the --help startup path."""
+    try:
+        import orjson
+    except ImportError:  # Optional: fall back to the stdlib json module
+        return None
+    return orjson
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize data as pretty-printed JSON for output."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def json_loads(content: Union[bytes, str]) -> Any:
+    """Deserialize a JSON document, e.g. an API response body."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def get_config_dir() -> str:
+    """Get the per-user configuration directory for Tractive CLI."""
+    base_dir = os.getenv('XDG_CONFIG_HOME') or os.path.expanduser('~/.config')
+    return os.path.join(base_dir, 'tractive-cli')
+
+
+def get_cache_dir() -> str:
+    """Get the per-user cache directory for Tractive CLI."""
+    base_dir = os.getenv('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base_dir, 'tractive-cli')
+
+
+# Last Unix timestamp formatted and its result; consecutive GPS fixes often share a second
+_last_timestamp: Tuple[Optional[int], Optional[str]] = (None, None)
+
+
+def format_timestamp(timestamp: Optional[Union[str, int, float]]) -> Optional[str]:
     """Format timestamp for consistent output."""
+    global _last_timestamp
+    
     if not timestamp:
         return None
     
-    try:
-        # Handle different timestamp formats
+    # Handle different timestamp formats
+    if isinstance(timestamp, str):
         if 'T' in timestamp:
             # ISO format
             return timestamp
-        else:
-            # Unix timestamp
-            dt = datetime.fromtimestamp(int(timestamp))
-            return dt.isoformat() + 'Z'
-    except (ValueError, TypeError):
+        try:
+            timestamp = int(timestamp)
+        except ValueError:
+            return timestamp
+    elif isinstance(timestamp, float):
+        timestamp = int(timestamp)
+    elif not isinstance(timestamp, int):
         return timestamp
+    
+    # Unix timestamp, rendered in UTC to match the 'Z' suffix
+    if _last_timestamp[0] == timestamp:
+        return _last_timestamp[1]
+    try:
+        formatted = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(timestamp))
+    except (OverflowError, OSError, ValueError):
+        return str(timestamp)
+    
+    _last_timestamp = (timestamp, formatted)
+    return formatted
 
 
+@functools.lru_cache(maxsize=1)
 def print_disclaimer():
     """Print disclaimer about unofficial API usage."""
-    # Only print once per session
-    disclaimer_file = '/tmp/.tractive_cli_disclaimer'
+    # Only print once per process, and once per user across invocations
+    disclaimer_file = os.path.join(get_cache_dir(), 'disclaimer_shown')
     
     if not os.path.exists(disclaimer_file):
         print("Note: This tool uses unofficial Tractive APIs and may break if endpoints change.", 
               file=sys.stderr)
         try:
+            os.makedirs(os.path.dirname(disclaimer_file), exist_ok=True)
             with open(disclaimer_file, 'w') as f:
                 f.write('shown')
-        except:
-            pass  # Ignore if we can't create the file
\ No newline at end of file
+        except OSError:
+            pass  # Ignore if we can't create the file